@@ -2,11 +2,20 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import numpy as np
+import bisect
+import functools
 import json
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 import calendar
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Page config
 st.set_page_config(
     page_title="💰 Weekly Income Flow Planner", 
@@ -15,9 +24,101 @@ st.set_page_config(
 )
 
 DATA_FILE = "income_plans.json"
-
-# Custom CSS for better styling
-st.markdown("""
+PLANS_DIR = "plans"
+EXPORT_FILE = "income_plans_export.json"
+
+# Bound method reused everywhere, so the format spec is parsed once
+fmt_money = "${:,.2f}".format
+
+def dump_json(obj, path, pretty=False):
+    """Serialize obj to path, using orjson when available (5-6x faster).
+
+    Hot-path saves stay compact; indentation roughly doubles the bytes
+    written and parsed, so it's opt-in for the human-readable export.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(path, "w") as f:
+            if pretty:
+                json.dump(obj, f, indent=2)
+            else:
+                json.dump(obj, f, separators=(",", ":"))
+
+def load_json(path):
+    """Parse JSON from path, using orjson when available"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+class PlanStore(dict):
+    """Week-key -> plan mapping backed by one JSON shard per week.
+
+    Plans are read from disk on first access, so an edit only rewrites the
+    single week it touched instead of re-serializing every plan.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._disk_keys = set()
+        if os.path.isdir(PLANS_DIR):
+            for name in os.listdir(PLANS_DIR):
+                if name.endswith(".json"):
+                    self._disk_keys.add(name[:-5])
+        # Index and aggregates live on the shared store, not per-session
+        # state, so every browser session sees one consistent view. One
+        # fused pass here; the mutation paths keep them current after that.
+        self.sorted_weeks = sorted(self._disk_keys)
+        self.income_sum = 0.0
+        self.over_budget_count = 0
+        for plan in self.values():
+            plan_income = plan.get("income", 0.0)
+            self.income_sum += plan_income
+            if plan_income - sum(plan.get("categories", {}).values()) < 0:
+                self.over_budget_count += 1
+
+    def __missing__(self, key):
+        if key in self._disk_keys:
+            plan = load_json(os.path.join(PLANS_DIR, key + ".json"))
+            dict.__setitem__(self, key, plan)
+            return plan
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._disk_keys
+
+    def __delitem__(self, key):
+        self._disk_keys.discard(key)
+        if dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(set(dict.keys(self)) | self._disk_keys)
+
+    def keys(self):
+        return sorted(set(dict.keys(self)) | self._disk_keys)
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+# Custom CSS for better styling; cached so reruns reuse one string object
+@st.cache_resource
+def page_css():
+    return """
 <style>
     .metric-card {
         background-color: #f0f2f6;
@@ -56,17 +157,23 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def get_week_key(date):
+st.markdown(page_css(), unsafe_allow_html=True)
+
+@functools.lru_cache(maxsize=512)
+def _monday_str(ordinal):
+    """Week key for the Monday of the week containing the given ordinal day"""
+    # Ordinal day 1 (0001-01-01) was a Monday, so no weekday()/timedelta needed
+    return date.fromordinal(ordinal - (ordinal - 1) % 7).strftime("%Y-%m-%d")
+
+def get_week_key(when):
     """Generate a unique key for a week based on the Monday of that week"""
-    # Find the Monday of the week containing the given date
-    days_since_monday = date.weekday()
-    monday = date - timedelta(days=days_since_monday)
-    return monday.strftime("%Y-%m-%d")
+    return _monday_str(when.toordinal())
 
+@functools.lru_cache(maxsize=4096)
 def get_week_display(week_key):
-    """Convert week key to display format"""
+    """Convert week key to display format (pure function of the key, so memoized)"""
     monday = datetime.strptime(week_key, "%Y-%m-%d")
     sunday = monday + timedelta(days=6)
     return f"Week of {monday.strftime('%b %d')} - {sunday.strftime('%b %d, %Y')}"
@@ -76,8 +183,7 @@ def migrate_old_data():
     old_file = "income_data.json"
     if os.path.exists(old_file) and not os.path.exists(DATA_FILE):
         try:
-            with open(old_file, "r") as f:
-                old_data = json.load(f)
+            old_data = load_json(old_file)
             
             # Get current week
             current_week = get_week_key(datetime.now())
@@ -95,28 +201,70 @@ def migrate_old_data():
             }
             
             # Save in new format
-            with open(DATA_FILE, "w") as f:
-                json.dump(new_data, f, indent=2)
+            dump_json(new_data, DATA_FILE)
             
             st.success("✅ Migrated your existing data to the new weekly format!")
             
         except Exception as e:
             st.error(f"Error migrating data: {e}")
 
+def migrate_monolithic_data():
+    """Split the single income_plans.json blob into per-week shard files"""
+    if os.path.exists(DATA_FILE) and not os.path.isdir(PLANS_DIR):
+        try:
+            data = load_json(DATA_FILE)
+            os.makedirs(PLANS_DIR, exist_ok=True)
+            for week_key, plan in data.get("plans", {}).items():
+                dump_json(plan, os.path.join(PLANS_DIR, week_key + ".json"))
+        except Exception as e:
+            st.error(f"Error sharding plan data: {e}")
+
+@functools.lru_cache(maxsize=512)
+def _metrics(income, cats_tuple):
+    """Compute metrics from hashable plan contents so unchanged plans hit the cache"""
+    total_allocated = sum(val for _, val in cats_tuple)
+    remaining = income - total_allocated
+    allocation_percentage = (total_allocated / income * 100) if income > 0 else 0
+    
+    return {
+        'total_allocated': total_allocated,
+        'remaining': remaining,
+        'allocation_percentage': allocation_percentage,
+        'over_budget': remaining < 0
+    }
+
+def calculate_metrics(plan):
+    """Calculate key financial metrics for a plan"""
+    cats_tuple = tuple(sorted(plan.get("categories", {}).items()))
+    return _metrics(plan.get("income", 0.0), cats_tuple)
+
+def register_week(week_key):
+    """Keep the shared sorted week index in sync when a plan is added"""
+    weeks = st.session_state.plans.sorted_weeks
+    idx = bisect.bisect_left(weeks, week_key)
+    if idx >= len(weeks) or weeks[idx] != week_key:
+        weeks.insert(idx, week_key)
+
+def update_aggregates(old_income, old_over, new_income, new_over):
+    """Adjust the shared overview aggregates after a single-plan change"""
+    store = st.session_state.plans
+    store.income_sum += new_income - old_income
+    store.over_budget_count += int(new_over) - int(old_over)
+
 # Initialize session state
 if 'current_week' not in st.session_state:
     st.session_state.current_week = get_week_key(datetime.now())
 
+@st.cache_resource
+def _load_plans():
+    """One PlanStore per server process, shared by every browser session"""
+    return PlanStore()
+
 if 'plans' not in st.session_state:
     # Try to migrate old data first
     migrate_old_data()
-    
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-            st.session_state.plans = data.get("plans", {})
-    else:
-        st.session_state.plans = {}
+    migrate_monolithic_data()
+    st.session_state.plans = _load_plans()
 
 # Ensure current week exists in plans
 if st.session_state.current_week not in st.session_state.plans:
@@ -126,34 +274,101 @@ if st.session_state.current_week not in st.session_state.plans:
         "created_at": datetime.now().isoformat(),
         "notes": ""
     }
-
-def save_data():
-    """Save all plans to JSON file"""
-    with open(DATA_FILE, "w") as f:
-        json.dump({"plans": st.session_state.plans}, f, indent=2)
+    register_week(st.session_state.current_week)
+    new_plan = st.session_state.plans[st.session_state.current_week]
+    update_aggregates(0.0, False, new_plan["income"], calculate_metrics(new_plan)['over_budget'])
+
+def save_plan(week_key):
+    """Persist a single week's plan to its own shard file"""
+    if week_key in st.session_state.plans:
+        os.makedirs(PLANS_DIR, exist_ok=True)
+        dump_json(st.session_state.plans[week_key], os.path.join(PLANS_DIR, week_key + ".json"))
+
+def delete_plan(week_key):
+    """Remove a plan along with its shard file"""
+    plan = st.session_state.plans[week_key]
+    update_aggregates(plan.get("income", 0.0), calculate_metrics(plan)['over_budget'], 0.0, False)
+    del st.session_state.plans[week_key]
+    if week_key in st.session_state.plans.sorted_weeks:
+        st.session_state.plans.sorted_weeks.remove(week_key)
+    st.session_state.get("_dirty_weeks", set()).discard(week_key)
+    shard = os.path.join(PLANS_DIR, week_key + ".json")
+    if os.path.exists(shard):
+        os.remove(shard)
+
+def mark_dirty(week_key=None):
+    """Flag a plan as having unsaved changes instead of writing it inline"""
+    if week_key is None:
+        week_key = st.session_state.current_week
+    st.session_state.setdefault("_dirty_weeks", set()).add(week_key)
+    st.session_state._last_change = time.time()
+
+def flush_save(force=False):
+    """Write any plans with pending changes to their shard files"""
+    if force:
+        mark_dirty()
+    dirty = st.session_state.get("_dirty_weeks")
+    if dirty:
+        for week_key in sorted(dirty):
+            save_plan(week_key)
+        dirty.clear()
+
+# Shared fallback for weeks without a plan; the st.stop() guard in the main
+# area keeps callers from ever mutating it
+_EMPTY_PLAN = {"categories": {}, "income": 0.0, "created_at": "", "notes": ""}
 
 def get_current_plan():
     """Get the currently selected plan"""
-    return st.session_state.plans.get(st.session_state.current_week, {
-        "categories": {},
-        "income": 0.0,
-        "created_at": datetime.now().isoformat(),
-        "notes": ""
-    })
+    return st.session_state.plans.get(st.session_state.current_week, _EMPTY_PLAN)
+
+@st.cache_data(max_entries=64)
+def build_sankey(cats_tuple, remaining):
+    """Build the income flow Sankey figure, cached by plan contents"""
+    labels = ["💰 Income"] + [f"💳 {cat}" for cat, _ in cats_tuple]
+    sources = [0] * len(cats_tuple)
+    targets = list(range(1, len(cats_tuple) + 1))
+    values = [val for _, val in cats_tuple]
+
+    if remaining > 0:
+        labels.append("💼 Unallocated")
+        sources.append(0)
+        targets.append(len(labels) - 1)
+        values.append(remaining)
+
+    fig = go.Figure(data=[go.Sankey(
+        node=dict(
+            pad=15,
+            thickness=20,
+            line=dict(color="black", width=0.5),
+            label=labels,
+        ),
+        link=dict(
+            source=sources,
+            target=targets,
+            value=values,
+            color=['rgba(31,119,180,0.3)'] * len(values)
+        )
+    )])
 
-def calculate_metrics(plan):
-    """Calculate key financial metrics for a plan"""
-    total_allocated = sum(plan.get("categories", {}).values())
-    income = plan.get("income", 0.0)
-    remaining = income - total_allocated
-    allocation_percentage = (total_allocated / income * 100) if income > 0 else 0
-    
-    return {
-        'total_allocated': total_allocated,
-        'remaining': remaining,
-        'allocation_percentage': allocation_percentage,
-        'over_budget': remaining < 0
-    }
+    fig.update_layout(
+        title_text="💸 Income Flow",
+        font_size=12,
+        height=400
+    )
+    return fig
+
+@st.cache_data(max_entries=64)
+def build_pie(cats_tuple):
+    """Build the category distribution pie chart, cached by category contents"""
+    fig = go.Figure(go.Pie(
+        labels=[cat for cat, _ in cats_tuple],
+        values=[val for _, val in cats_tuple],
+        textposition='inside',
+        textinfo='percent+label',
+        marker=dict(colors=px.colors.qualitative.Set3)
+    ))
+    fig.update_layout(title='💰 Category Distribution', height=400)
+    return fig
 
 # Header
 st.title("📅 Weekly Income Flow Planner")
@@ -172,6 +387,7 @@ with st.sidebar:
     
     with col1:
         if st.button("⬅️ Prev"):
+            flush_save()
             current_date = datetime.strptime(st.session_state.current_week, "%Y-%m-%d")
             prev_week = current_date - timedelta(days=7)
             st.session_state.current_week = get_week_key(prev_week)
@@ -179,11 +395,13 @@ with st.sidebar:
     
     with col2:
         if st.button("📅 Today"):
+            flush_save()
             st.session_state.current_week = get_week_key(datetime.now())
             st.rerun()
     
     with col3:
         if st.button("➡️ Next"):
+            flush_save()
             current_date = datetime.strptime(st.session_state.current_week, "%Y-%m-%d")
             next_week = current_date + timedelta(days=7)
             st.session_state.current_week = get_week_key(next_week)
@@ -219,17 +437,22 @@ with st.sidebar:
                 "created_at": datetime.now().isoformat(),
                 "notes": ""
             }
-            save_data()
+            register_week(st.session_state.current_week)
+            new_plan = st.session_state.plans[st.session_state.current_week]
+            update_aggregates(0.0, False, new_plan["income"], calculate_metrics(new_plan)['over_budget'])
+            mark_dirty()
+            flush_save()
             st.rerun()
     
     # Copy from template/previous week
     if st.session_state.plans:
         st.markdown("**Copy from existing plan:**")
-        template_weeks = list(st.session_state.plans.keys())
+        template_weeks = st.session_state.plans.sorted_weeks
+        display_map = {week_key: get_week_display(week_key) for week_key in template_weeks}
         template_week = st.selectbox(
             "Select template week",
             options=template_weeks,
-            format_func=get_week_display,
+            format_func=display_map.__getitem__,
             key="template_selector"
         )
         
@@ -237,8 +460,13 @@ with st.sidebar:
             template_plan = st.session_state.plans[template_week].copy()
             template_plan["created_at"] = datetime.now().isoformat()
             template_plan["notes"] = f"Copied from {get_week_display(template_week)}"
+            old_plan = st.session_state.plans.get(st.session_state.current_week, _EMPTY_PLAN)
+            update_aggregates(old_plan.get("income", 0.0), calculate_metrics(old_plan)['over_budget'],
+                              template_plan.get("income", 0.0), calculate_metrics(template_plan)['over_budget'])
             st.session_state.plans[st.session_state.current_week] = template_plan
-            save_data()
+            register_week(st.session_state.current_week)
+            mark_dirty()
+            flush_save()
             st.success("Plan copied successfully!")
             st.rerun()
     
@@ -250,16 +478,20 @@ with st.sidebar:
     col1, col2 = st.columns(2)
     with col1:
         if st.button("💾 Save"):
-            save_data()
+            flush_save(force=True)
             st.success("Saved!")
     
     with col2:
         if st.button("🗑️ Delete"):
             if st.session_state.current_week in st.session_state.plans:
-                del st.session_state.plans[st.session_state.current_week]
-                save_data()
+                delete_plan(st.session_state.current_week)
                 st.success("Plan deleted!")
                 st.rerun()
+    
+    if st.button("📤 Export Pretty JSON"):
+        flush_save()
+        dump_json({"plans": dict(st.session_state.plans.items())}, EXPORT_FILE, pretty=True)
+        st.success(f"Exported to {EXPORT_FILE}")
 
 # Main content area
 if st.session_state.current_week not in st.session_state.plans:
@@ -280,7 +512,7 @@ notes = st.text_area(
 )
 if notes != current_plan.get("notes", ""):
     st.session_state.plans[st.session_state.current_week]["notes"] = notes
-    save_data()
+    mark_dirty()
 
 # Income and metrics
 col1, col2 = st.columns([3, 2])
@@ -296,30 +528,33 @@ with col1:
     )
     
     if income != current_plan.get("income", 0.0):
+        old_income = current_plan.get("income", 0.0)
+        old_over = calculate_metrics(current_plan)['over_budget']
         st.session_state.plans[st.session_state.current_week]["income"] = income
-        save_data()
+        mark_dirty()
+        update_aggregates(old_income, old_over, income, calculate_metrics(current_plan)['over_budget'])
+
+# Calculate metrics once per rerun; every consumer below reads this dict
+metrics = calculate_metrics(current_plan)
 
 with col2:
-    # Calculate and display metrics
-    metrics = calculate_metrics(current_plan)
-    
     if metrics['over_budget']:
-        st.error(f"⚠️ Over budget by ${abs(metrics['remaining']):,.2f}")
+        st.error(f"⚠️ Over budget by {fmt_money(abs(metrics['remaining']))}")
     elif metrics['remaining'] < 50:
-        st.warning(f"⚡ Low remaining: ${metrics['remaining']:,.2f}")
+        st.warning(f"⚡ Low remaining: {fmt_money(metrics['remaining'])}")
     else:
-        st.success(f"✅ Remaining: ${metrics['remaining']:,.2f}")
+        st.success(f"✅ Remaining: {fmt_money(metrics['remaining'])}")
 
 # Key metrics row
 metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
 
 with metric_col1:
-    st.metric("Weekly Income", f"${current_plan.get('income', 0):,.2f}")
+    st.metric("Weekly Income", fmt_money(current_plan.get('income', 0)))
 
 with metric_col2:
     st.metric(
         "Allocated", 
-        f"${metrics['total_allocated']:,.2f}",
+        fmt_money(metrics['total_allocated']),
         f"{metrics['allocation_percentage']:.1f}%"
     )
 
@@ -327,7 +562,7 @@ with metric_col3:
     delta_color = "normal" if metrics['remaining'] >= 0 else "inverse"
     st.metric(
         "Remaining", 
-        f"${metrics['remaining']:,.2f}",
+        fmt_money(metrics['remaining']),
         delta_color=delta_color
     )
 
@@ -343,64 +578,53 @@ cat_col1, cat_col2 = st.columns([2, 1])
 
 with cat_col1:
     categories = current_plan.get("categories", {})
-    
-    # Display existing categories
-    for i, (cat, val) in enumerate(list(categories.items())):
-        with st.expander(f"💰 {cat}: ${val:,.2f}", expanded=i < 4):
-            col_amount, col_delete = st.columns([4, 1])
-            
-            with col_amount:
-                new_val = st.number_input(
-                    "Amount ($)",
-                    min_value=0.0,
-                    step=10.0,
-                    value=float(val),
-                    key=f"amount_{cat}_{st.session_state.current_week}",
-                    help=f"Set amount for {cat}"
-                )
-                
-                if new_val != val:
-                    st.session_state.plans[st.session_state.current_week]["categories"][cat] = new_val
-                    save_data()
-            
-            with col_delete:
-                if st.button("🗑️", key=f"delete_{cat}_{st.session_state.current_week}", help=f"Delete {cat}"):
-                    del st.session_state.plans[st.session_state.current_week]["categories"][cat]
-                    save_data()
-                    st.rerun()
-    
-    # Add new category
-    st.markdown("---")
-    st.markdown("**➕ Add New Category**")
-    new_cat_col1, new_cat_col2, new_cat_col3 = st.columns([2, 1, 1])
-    
-    with new_cat_col1:
-        new_cat = st.text_input("Category Name", placeholder="e.g., Entertainment", key=f"new_cat_{st.session_state.current_week}")
-    
-    with new_cat_col2:
-        new_cat_amount = st.number_input("Amount", min_value=0.0, step=10.0, value=50.0, key=f"new_amount_{st.session_state.current_week}")
-    
-    with new_cat_col3:
-        if st.button("Add", key=f"add_cat_{st.session_state.current_week}"):
-            if new_cat and new_cat not in categories:
-                st.session_state.plans[st.session_state.current_week]["categories"][new_cat] = new_cat_amount
-                save_data()
-                st.rerun()
-            elif new_cat in categories:
-                st.error("Category exists!")
-            else:
-                st.error("Enter category name!")
+
+    # One editable grid instead of an expander + input + delete button per category;
+    # num_rows="dynamic" covers adding and removing rows too
+    edited = st.data_editor(
+        pd.DataFrame({"Category": list(categories), "Amount": list(categories.values())}),
+        num_rows="dynamic",
+        use_container_width=True,
+        hide_index=True,
+        key=f"cat_editor_{st.session_state.current_week}",
+        column_config={
+            "Category": st.column_config.TextColumn(required=True),
+            "Amount": st.column_config.NumberColumn(format="$%.2f", min_value=0.0, step=10.0)
+        }
+    )
+
+    edited_categories = {}
+    for cat, amount in zip(edited["Category"], edited["Amount"]):
+        if isinstance(cat, str) and cat and not pd.isna(amount):
+            edited_categories[cat] = float(amount)
+
+    if edited_categories != categories:
+        old_over = calculate_metrics(current_plan)['over_budget']
+        st.session_state.plans[st.session_state.current_week]["categories"] = edited_categories
+        categories = edited_categories
+        mark_dirty()
+        update_aggregates(income, old_over, income, calculate_metrics(current_plan)['over_budget'])
 
 with cat_col2:
     st.markdown("**📈 Allocation Breakdown**")
-    
-    # Show percentage breakdown
-    if current_plan.get("income", 0) > 0:
-        for cat, val in categories.items():
-            percentage = (val / current_plan["income"]) * 100
-            st.markdown(f"**{cat}**")
-            st.progress(min(percentage / 100, 1.0))
-            st.caption(f"{percentage:.1f}% (${val:,.2f})")
+
+    # One bar chart payload instead of a markdown/progress/caption trio per category
+    if income > 0 and categories:
+        pcts = np.fromiter(categories.values(), dtype=np.float64, count=len(categories)) / income * 100
+        breakdown_fig = go.Figure(go.Bar(
+            y=list(categories),
+            x=pcts,
+            orientation='h',
+            text=[f"{pct:.1f}% ({fmt_money(val)})" for pct, val in zip(pcts, categories.values())],
+            textposition='auto'
+        ))
+        breakdown_fig.update_layout(
+            height=max(200, 40 * len(categories)),
+            margin=dict(l=0, r=0, t=10, b=10),
+            xaxis_title="% of income",
+            yaxis=dict(autorange="reversed")
+        )
+        st.plotly_chart(breakdown_fig, use_container_width=True)
     else:
         st.info("Set income to see percentages")
 
@@ -408,98 +632,74 @@ with cat_col2:
 st.markdown("---")
 st.subheader("📊 Visualizations")
 
+cats_tuple = tuple(sorted(categories.items()))
 chart_col1, chart_col2 = st.columns(2)
 
 with chart_col1:
     # Sankey Chart
     if categories:
-        labels = ["💰 Income"] + [f"💳 {cat}" for cat in categories.keys()]
-        
-        if metrics['remaining'] > 0:
-            labels.append("💼 Unallocated")
-        
-        sources = [0] * len(categories)
-        targets = list(range(1, len(categories) + 1))
-        values = list(categories.values())
-        
-        if metrics['remaining'] > 0:
-            sources.append(0)
-            targets.append(len(labels) - 1)
-            values.append(metrics['remaining'])
-        
-        sankey_fig = go.Figure(data=[go.Sankey(
-            node=dict(
-                pad=15,
-                thickness=20,
-                line=dict(color="black", width=0.5),
-                label=labels,
-            ),
-            link=dict(
-                source=sources,
-                target=targets,
-                value=values,
-                color=['rgba(31,119,180,0.3)'] * len(values)
-            )
-        )])
-        
-        sankey_fig.update_layout(
-            title_text="💸 Income Flow",
-            font_size=12,
-            height=400
-        )
-        st.plotly_chart(sankey_fig, use_container_width=True)
+        st.plotly_chart(build_sankey(cats_tuple, metrics['remaining']), use_container_width=True)
 
 with chart_col2:
     # Pie chart
     if categories:
-        df = pd.DataFrame(list(categories.items()), columns=['Category', 'Amount'])
-        
-        pie_fig = px.pie(
-            df, 
-            values='Amount', 
-            names='Category',
-            title='💰 Category Distribution',
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        pie_fig.update_traces(textposition='inside', textinfo='percent+label')
-        pie_fig.update_layout(height=400)
-        st.plotly_chart(pie_fig, use_container_width=True)
+        st.plotly_chart(build_pie(cats_tuple), use_container_width=True)
 
 # Plans overview section
 if len(st.session_state.plans) > 1:
     st.markdown("---")
     st.subheader("📋 All Plans Overview")
     
-    # Create summary table
-    summary_data = []
-    for week_key, plan in sorted(st.session_state.plans.items()):
-        plan_metrics = calculate_metrics(plan)
-        summary_data.append({
-            'Week': get_week_display(week_key),
-            'Income': f"${plan.get('income', 0):,.2f}",
-            'Allocated': f"${plan_metrics['total_allocated']:,.2f}",
-            'Remaining': f"${plan_metrics['remaining']:,.2f}",
-            'Categories': len(plan.get('categories', {})),
-            'Status': '🔴 Over Budget' if plan_metrics['over_budget'] else 
-                     '🟡 Tight' if plan_metrics['remaining'] < 50 else '🟢 Good'
-        })
-    
-    if summary_data:
-        summary_df = pd.DataFrame(summary_data)
-        st.dataframe(summary_df, use_container_width=True, hide_index=True)
-        
-        # Quick stats
-        total_weeks = len(st.session_state.plans)
-        avg_income = sum(plan.get('income', 0) for plan in st.session_state.plans.values()) / total_weeks
-        over_budget_weeks = sum(1 for plan in st.session_state.plans.values() if calculate_metrics(plan)['over_budget'])
-        
-        stat_col1, stat_col2, stat_col3 = st.columns(3)
-        with stat_col1:
-            st.metric("Total Plans", total_weeks)
-        with stat_col2:
-            st.metric("Avg Weekly Income", f"${avg_income:,.2f}")
-        with stat_col3:
-            st.metric("Over Budget Weeks", over_budget_weeks)
+    # Build the summary in one vectorized pass instead of per-row Python sums;
+    # sorted_weeks is kept ordered incrementally, so no per-rerun sort here.
+    # Snapshot the shared index and tolerate keys a concurrent session deleted.
+    sorted_plans = []
+    for week_key in list(st.session_state.plans.sorted_weeks):
+        plan = st.session_state.plans.get(week_key)
+        if plan is not None:
+            sorted_plans.append((week_key, plan))
+    total_weeks = len(sorted_plans)
+    incomes = np.fromiter((plan.get("income", 0.0) for _, plan in sorted_plans), dtype=np.float64, count=total_weeks)
+    totals = np.fromiter((sum(plan.get("categories", {}).values()) for _, plan in sorted_plans), dtype=np.float64, count=total_weeks)
+    cat_counts = np.fromiter((len(plan.get("categories", {})) for _, plan in sorted_plans), dtype=np.int64, count=total_weeks)
+    remaining = incomes - totals
+    over_budget = remaining < 0
+
+    # Downcast dtypes and keep amounts numeric; formatting happens client-side
+    summary_df = pd.DataFrame({
+        'Week': [get_week_display(week_key) for week_key, _ in sorted_plans],
+        'Income': incomes.astype(np.float32),
+        'Allocated': totals.astype(np.float32),
+        'Remaining': remaining.astype(np.float32),
+        'Categories': cat_counts.astype(np.int16),
+        'Status': pd.Categorical(
+            np.where(over_budget, '🔴 Over Budget',
+                     np.where(remaining < 50, '🟡 Tight', '🟢 Good')),
+            categories=['🟢 Good', '🟡 Tight', '🔴 Over Budget'])
+    })
+    money_column = st.column_config.NumberColumn(format="$%.2f")
+    st.dataframe(
+        summary_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={'Income': money_column, 'Allocated': money_column, 'Remaining': money_column}
+    )
+
+    # Quick stats from the shared running aggregates (O(1) per rerun)
+    avg_income = st.session_state.plans.income_sum / total_weeks if total_weeks else 0.0
+    over_budget_weeks = st.session_state.plans.over_budget_count
+
+    stat_col1, stat_col2, stat_col3 = st.columns(3)
+    with stat_col1:
+        st.metric("Total Plans", total_weeks)
+    with stat_col2:
+        st.metric("Avg Weekly Income", fmt_money(avg_income))
+    with stat_col3:
+        st.metric("Over Budget Weeks", over_budget_weeks)
+
+# Debounced flush: collapse the burst of edits from a rerun into one write
+if st.session_state.get("_dirty_weeks") and time.time() - st.session_state._last_change > 1.0:
+    flush_save()
 
 # Footer
 st.markdown("---")